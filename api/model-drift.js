@@ -0,0 +1,36 @@
+/**
+ * API Endpoint: Model Drift
+ *
+ * Devuelve el último reporte de drift (predicciones en vivo vs precio real)
+ * guardado por /api/trade. Es best effort: el log de predicciones vive en la
+ * memoria de la instancia que ejecutó el ciclo y se reinicia en cada
+ * arranque en frío.
+ */
+
+const { isDriftStoreConfigured, loadDriftReport } = require('../src/drift-store');
+
+module.exports = async (req, res) => {
+  try {
+    const persisted = isDriftStoreConfigured();
+    const drift = persisted ? await loadDriftReport() : null;
+
+    res.status(200).json({
+      success: true,
+      persisted: persisted,
+      drift: drift,
+      note: persisted
+        ? 'Último ciclo guardado por /api/trade. Datos de una sola instancia, se reinician en arranques en frío.'
+        : 'Sin almacenamiento compartido (KV_REST_API_URL / KV_REST_API_TOKEN): no hay reporte disponible.',
+      timestamp: new Date().toISOString()
+    });
+
+  } catch (error) {
+    console.error('❌ Error consultando drift:', error);
+
+    res.status(500).json({
+      success: false,
+      error: error.message,
+      timestamp: new Date().toISOString()
+    });
+  }
+};
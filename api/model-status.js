@@ -52,6 +52,7 @@ module.exports = async (req, res) => {
       actions: {
         refresh: '/api/refresh-models',
         status: '/api/model-status',
+        drift: '/api/model-drift',
         trade: '/api/trade'
       },
       timestamp: new Date().toISOString()
@@ -70,6 +70,7 @@ module.exports = async (req, res) => {
         metadata: modelInfo.metadata,
         models: modelInfo.models.map(model => ({
           symbol: model.symbol,
+          format: model.format,
           algorithm: model.algorithm,
           performance: `${(model.performance * 100).toFixed(2)}%`,
           trainedAt: model.trainedAt,
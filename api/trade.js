@@ -3,15 +3,17 @@ const TradingStrategy = require('../src/strategy');
 let strategy = null;
 
 module.exports = async (req, res) => {
+  const startTime = Date.now();
+
   try {
     // Inicializar estrategia si no existe
     if (!strategy) {
       strategy = new TradingStrategy();
-      await strategy.initialize();
+      await strategy.initialize(startTime);
     }
 
     // Ejecutar estrategia de trading
-    await strategy.executeScalpingStrategy();
+    await strategy.executeScalpingStrategy(startTime);
 
     const status = await strategy.getStatus();
     
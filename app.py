@@ -2,14 +2,19 @@
 🤖 TRADING BOT DASHBOARD
 ========================
 Dashboard en tiempo real con sincronización automática
+
+pandas y plotly se importan después del sidebar y alpaca dentro de las
+funciones que lo usan, para que el header y el estado se pinten sin esperar
+esas importaciones en un arranque en frío. Ver benchmarks/import_time.py.
 """
 
-import streamlit as st
-import pandas as pd
-import plotly.graph_objects as go
+import threading
 from datetime import datetime, timedelta
+
+import streamlit as st
 import requests
 from streamlit_autorefresh import st_autorefresh
+from utils.universe import load_universe, SymbolIndex
 
 # Auto-refresh cada 30 segundos
 count = st_autorefresh(interval=30000, key="data_refresh")
@@ -92,25 +97,53 @@ class APIClient:
 
 api = APIClient(st.secrets["VERCEL_API_URL"])
 
+# ============================================================================
+# PREWARM
+# ============================================================================
+
+def _import_heavy_modules():
+    """Importar módulos pesados mientras el hilo principal espera la red"""
+    import pandas  # noqa: F401
+    import plotly.graph_objects  # noqa: F401
+    import alpaca.trading.client  # noqa: F401
+    import alpaca.data.historical  # noqa: F401
+
+@st.cache_resource
+def prewarm_imports():
+    """Lanzar la importación en segundo plano una sola vez por proceso"""
+    thread = threading.Thread(target=_import_heavy_modules, daemon=True)
+    thread.start()
+    return thread
+
+prewarm_imports()
+
 # ============================================================================
 # ALPACA DATA FETCHER
 # ============================================================================
 
-from alpaca.trading.client import TradingClient
-from alpaca.trading.requests import GetAssetsRequest
-from alpaca.data.historical import CryptoHistoricalDataClient
-from alpaca.data.requests import CryptoBarsRequest
-from alpaca.data.timeframe import TimeFrame
+@st.cache_resource
+def get_trading_client():
+    """Cliente de trading compartido entre sesiones"""
+    from alpaca.trading.client import TradingClient
+    
+    return TradingClient(
+        st.secrets["ALPACA_API_KEY"],
+        st.secrets["ALPACA_SECRET_KEY"],
+        paper=True
+    )
+
+@st.cache_resource
+def get_crypto_data_client():
+    """Cliente de datos históricos compartido entre sesiones"""
+    from alpaca.data.historical import CryptoHistoricalDataClient
+    
+    return CryptoHistoricalDataClient()
 
 @st.cache_data(ttl=60)
 def get_alpaca_data():
     """Obtener datos de Alpaca con cache"""
     try:
-        client = TradingClient(
-            st.secrets["ALPACA_API_KEY"],
-            st.secrets["ALPACA_SECRET_KEY"],
-            paper=True
-        )
+        client = get_trading_client()
         
         account = client.get_account()
         positions = client.get_all_positions()
@@ -142,7 +175,10 @@ def get_alpaca_data():
 def get_crypto_chart_data(symbol, timeframe='15Min', limit=100):
     """Obtener datos de gráficas"""
     try:
-        client = CryptoHistoricalDataClient()
+        from alpaca.data.requests import CryptoBarsRequest
+        from alpaca.data.timeframe import TimeFrame
+        
+        client = get_crypto_data_client()
         
         request = CryptoBarsRequest(
             symbol_or_symbols=symbol,
@@ -158,6 +194,11 @@ def get_crypto_chart_data(symbol, timeframe='15Min', limit=100):
         st.error(f"Error obteniendo datos de {symbol}: {e}")
         return None
 
+@st.cache_resource
+def get_symbol_index():
+    """Índice de búsqueda del universo de símbolos"""
+    return SymbolIndex(load_universe())
+
 # ============================================================================
 # SIDEBAR
 # ============================================================================
@@ -214,6 +255,10 @@ with st.sidebar:
 # MAIN CONTENT
 # ============================================================================
 
+# Header y sidebar ya están pintados; el prewarm suele haber terminado
+import pandas as pd
+import plotly.graph_objects as go
+
 # Obtener datos
 alpaca_data = get_alpaca_data()
 
@@ -298,7 +343,14 @@ if alpaca_data:
         st.subheader("📈 Price Charts")
         
         # Selector de símbolo
-        symbols = ['BTC/USD', 'ETH/USD', 'LTC/USD', 'BCH/USD', 'DOGE/USD']
+        symbol_index = get_symbol_index()
+        symbol_query = st.text_input("Search Symbol", placeholder=f"{len(symbol_index)} symbols (e.g. BTC, ether)")
+        symbols = symbol_index.search(symbol_query)
+        
+        if not symbols:
+            st.warning(f"No hay símbolos que coincidan con '{symbol_query}'")
+            symbols = symbol_index.search('')
+        
         selected_symbol = st.selectbox("Select Symbol", symbols)
         
         col1, col2 = st.columns([3, 1])
@@ -440,7 +492,90 @@ if alpaca_data:
                 st.plotly_chart(fig, use_container_width=True)
         else:
             st.warning("No se pudo cargar el estado de los modelos")
-    
+
+        # Drift: predicciones en vivo vs movimiento real del precio
+        st.divider()
+        st.subheader("📉 Live Model Drift")
+
+        drift_response = api.get("/api/model-drift")
+        drift = drift_response.get('drift') if drift_response.get('success') else None
+
+        # El log vive en memoria de una instancia de /api/trade: best effort
+        st.caption(
+            "ℹ️ Datos best effort de la última instancia de trading que guardó su reporte; "
+            "se reinician en cada arranque en frío."
+        )
+
+        if drift and drift.get('models'):
+            st.caption(
+                f"Cubierto: {drift['coveredHours']:.1f}h de {drift['windowHours']:.0f}h · "
+                f"Horizonte: {drift['horizonMinutes']:.0f} min · "
+                f"{drift['resolvedPredictions']}/{drift['totalPredictions']} predicciones resueltas"
+            )
+
+            df_drift = pd.DataFrame(drift['models']).drop(columns=['calibration'])
+
+            # Modelos con suficientes muestras que fallan o están mal calibrados
+            decaying = df_drift[
+                df_drift['reliable'] & ((df_drift['hitRate'] < 0.5) | (df_drift['calibrationError'] > 0.15))
+            ]
+            if not decaying.empty:
+                st.warning(
+                    "⚠️ Posible degradación: "
+                    + ", ".join(f"{r.symbol} ({r.algorithm})" for r in decaying.itertuples())
+                )
+
+            st.dataframe(
+                df_drift,
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    'symbol': st.column_config.TextColumn('Symbol', width="small"),
+                    'algorithm': st.column_config.TextColumn('Algorithm', width="small"),
+                    'samples': st.column_config.NumberColumn('Samples'),
+                    'hitRate': st.column_config.NumberColumn('Hit Rate', format="%.3f"),
+                    'avgConfidence': st.column_config.NumberColumn('Avg Confidence', format="%.3f"),
+                    'avgReturn': st.column_config.NumberColumn('Avg Return', format="%.4f"),
+                    'brierScore': st.column_config.NumberColumn('Brier', format="%.3f"),
+                    'calibrationError': st.column_config.NumberColumn('Calibration Error', format="%.3f"),
+                    'reliable': st.column_config.CheckboxColumn('Enough Samples')
+                }
+            )
+
+            labels = [f"{m['symbol']} ({m['algorithm']})" for m in drift['models']]
+            fig = go.Figure(data=[
+                go.Bar(
+                    name='Hit Rate',
+                    x=labels,
+                    y=[m['hitRate'] * 100 for m in drift['models']],
+                    marker_color='#00ff00'
+                ),
+                go.Bar(
+                    name='Avg Confidence',
+                    x=labels,
+                    y=[m['avgConfidence'] * 100 for m in drift['models']],
+                    marker_color='#00aaff'
+                )
+            ])
+
+            fig.update_layout(
+                title='Live Hit Rate vs Confidence',
+                yaxis_title='%',
+                barmode='group',
+                template='plotly_dark',
+                height=400
+            )
+
+            st.plotly_chart(fig, use_container_width=True)
+        elif drift:
+            st.info(
+                f"📭 Aún no hay predicciones resueltas: {drift['totalPredictions']} registradas, "
+                f"se resuelven tras {drift['horizonMinutes']:.0f} min "
+                f"(cubierto: {drift['coveredHours']:.1f}h de {drift['windowHours']:.0f}h)"
+            )
+        else:
+            st.info(f"📭 {drift_response.get('note') or 'No hay reporte de drift disponible'}")
+
     with tab4:
         st.subheader("📋 Recent Activity")
         
@@ -0,0 +1,205 @@
+"""
+Reporte de tiempo de importación del dashboard
+==============================================
+Mide con `python -X importtime` cuánto cuesta cada import de app.py y separa
+los que ocurren antes del primer pintado (nivel de módulo, antes de la
+primera llamada `st.*` que dibuja algo) de los que ocurren después. Streamlit
+ejecuta el cuerpo de todas las pestañas en cada ejecución, así que los
+imports de después del primer pintado no se evitan: solo se hacen cuando el
+header y el estado ya están en pantalla.
+
+Con --baseline se mide también app.py en otra revisión de git (por ejemplo
+la anterior a diferir pandas, plotly y alpaca) y se reporta la diferencia.
+
+Uso:
+    python benchmarks/import_time.py [--runs 3] [--baseline <ref>]
+"""
+
+import argparse
+import ast
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+APP_PATH = ROOT / 'app.py'
+
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+
+def first_paint_line(tree: ast.Module) -> int:
+    """Línea de la primera sentencia de nivel de módulo que dibuja con `st.*`"""
+    for node in tree.body:
+        target = node.items[0].context_expr if isinstance(node, ast.With) else getattr(node, 'value', None)
+        if isinstance(target, ast.Call):
+            target = target.func
+        if (
+            isinstance(target, ast.Attribute)
+            and isinstance(target.value, ast.Name)
+            and target.value.id == 'st'
+            and target.attr != 'set_page_config'
+        ):
+            return node.lineno
+    return sys.maxsize
+
+
+def collect_imports(source: str) -> Dict[str, List[str]]:
+    """Separar imports de antes y después del primer pintado, y listar los
+    de nivel de módulo (los que se pagan aunque no se use la pestaña)"""
+    tree = ast.parse(source)
+    paint_line = first_paint_line(tree)
+    module_level = {id(node) for node in tree.body}
+    before_paint = {id(node) for node in tree.body if node.lineno < paint_line}
+
+    imports = {'before_first_paint': [], 'after_first_paint': [], 'module_level': []}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            names = [node.module]
+        else:
+            continue
+
+        group = 'before_first_paint' if id(node) in before_paint else 'after_first_paint'
+        for name in names:
+            if name not in imports[group]:
+                imports[group].append(name)
+            if id(node) in module_level and name not in imports['module_level']:
+                imports['module_level'].append(name)
+
+    # Un módulo importado arriba ya no cuesta nada al volver a importarlo
+    imports['after_first_paint'] = [
+        m for m in imports['after_first_paint'] if m not in imports['before_first_paint']
+    ]
+    return imports
+
+
+def measure_import(module: str) -> Optional[int]:
+    """Tiempo acumulado (µs) de importar un módulo en un intérprete limpio"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT,
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        return None
+
+    for line in reversed(result.stderr.splitlines()):
+        match = IMPORTTIME_LINE.match(line)
+        if match and match.group(4) == module:
+            return int(match.group(2))
+    return None
+
+
+def measure_group(modules: List[str]) -> Optional[int]:
+    """Tiempo (µs) de importar varios módulos juntos, sin contar dos veces
+    las dependencias compartidas: suma de las entradas de primer nivel que
+    siguen al arranque del intérprete (`site`)"""
+    if not modules:
+        return 0
+
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', '; '.join(f'import {m}' for m in modules)],
+        cwd=ROOT,
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        return None
+
+    total = 0
+    after_startup = False
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match or len(match.group(3)) != 1:
+            continue
+        if after_startup:
+            total += int(match.group(2))
+        elif match.group(4) == 'site':
+            after_startup = True
+    return total
+
+
+def read_app_source(ref: Optional[str] = None) -> str:
+    """app.py del working tree o de una revisión de git"""
+    if ref is None:
+        return APP_PATH.read_text(encoding='utf-8')
+
+    result = subprocess.run(
+        ['git', 'show', f'{ref}:app.py'],
+        cwd=ROOT,
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"No se pudo leer app.py en {ref}: {result.stderr.strip()}")
+    return result.stdout
+
+
+def measure_groups(label: str, imports: Dict[str, List[str]], runs: int,
+                   cache: Dict[str, Optional[float]], missing: List[str]) -> Dict[str, float]:
+    """Medir cada grupo de imports; `cache` evita medir dos veces un módulo"""
+    totals = {}
+
+    for group, modules in imports.items():
+        print(f"\n== {label}: {group} ({len(modules)} módulos) ==")
+        print(f"{'module':<36}{'cumulative (ms)':>18}")
+        installed = []
+
+        for module in modules:
+            if module not in cache:
+                samples = [measure_import(module) for _ in range(runs)]
+                cache[module] = None if any(s is None for s in samples) else statistics.median(samples) / 1000
+            ms = cache[module]
+            if ms is None:
+                print(f"{module:<36}{'no instalado':>18}")
+                if module not in missing:
+                    missing.append(module)
+                continue
+            installed.append(module)
+            print(f"{module:<36}{ms:>18.1f}")
+
+        # Medido junto en un solo intérprete: el total no es la suma de la columna
+        samples = [measure_group(installed) for _ in range(runs)]
+        total = statistics.median(s for s in samples if s is not None) / 1000 if any(samples) else 0.0
+        totals[group] = total
+        print(f"{'total (juntos)':<36}{total:>18.1f}")
+
+    return totals
+
+
+def report(runs: int, baseline: Optional[str] = None) -> None:
+    cache: Dict[str, Optional[float]] = {}
+    missing: List[str] = []
+
+    totals = measure_groups('actual', collect_imports(read_app_source()), runs, cache, missing)
+    if baseline:
+        base_totals = measure_groups(baseline, collect_imports(read_app_source(baseline)), runs, cache, missing)
+
+    print("\n== resumen ==")
+    for group, title in (('before_first_paint', 'Antes del primer pintado'),
+                         ('after_first_paint', 'Después del primer pintado'),
+                         ('module_level', 'A nivel de módulo')):
+        line = f"{title}: {totals[group]:.1f} ms"
+        if baseline:
+            diff = totals[group] - base_totals[group]
+            line += f" (en {baseline}: {base_totals[group]:.1f} ms, diferencia {diff:+.1f} ms)"
+        print(line)
+    if missing:
+        print(f"Excluidos de los totales (no instalados): {', '.join(missing)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=3, help='repeticiones por módulo (se usa la mediana)')
+    parser.add_argument('--baseline', metavar='REF', help='revisión de git con la que comparar app.py')
+    args = parser.parse_args()
+    report(args.runs, args.baseline)
+
+
+if __name__ == '__main__':
+    main()
@@ -41,6 +41,24 @@ class AlpacaClient {
     }
   }
 
+  async getCryptoPrices(symbols) {
+    // Una llamada por lote en vez de una por símbolo
+    const prices = {};
+    for (let i = 0; i < symbols.length; i += 100) {
+      const batch = symbols.slice(i, i + 100);
+      try {
+        const bars = await this.alpaca.getLatestCryptoBars(batch);
+        for (const symbol of batch) {
+          const bar = bars instanceof Map ? bars.get(symbol) : bars[symbol];
+          if (bar) prices[symbol] = bar.Close ?? bar.c;
+        }
+      } catch (error) {
+        console.error('Error obteniendo precios en lote:', error);
+      }
+    }
+    return prices;
+  }
+
   async placeCryptoOrder(symbol, qty, side) {
     try {
       const order = await this.alpaca.createOrder({
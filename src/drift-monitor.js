@@ -0,0 +1,217 @@
+/**
+ * Monitor de drift de modelos
+ *
+ * Cruza las predicciones del PredictionLog con el precio real observado
+ * `horizonMs` después y calcula, por símbolo y algoritmo, el hit rate y la
+ * calibración (confianza declarada vs aciertos) en una ventana móvil.
+ * Solo se evalúan señales direccionales (buy/sell).
+ */
+
+const { ACTIONS } = require('./prediction-log');
+
+const DEFAULT_OPTIONS = {
+  horizonMs: 15 * 60 * 1000, // 15 minutos
+  windowMs: 24 * 60 * 60 * 1000, // 24 horas
+  bins: 5,
+  minSamples: 20
+};
+
+class DriftMonitor {
+  constructor(predictionLog, options = {}) {
+    this.log = predictionLog;
+    this.options = { ...DEFAULT_OPTIONS, ...options };
+    this.report = this.emptyReport();
+  }
+
+  emptyReport() {
+    return {
+      generatedAt: null,
+      horizonMinutes: this.options.horizonMs / 60000,
+      windowHours: this.options.windowMs / 3600000,
+      // Lapso realmente cubierto por el log (menor a la ventana tras un arranque en frío)
+      coveredFrom: null,
+      coveredHours: 0,
+      totalPredictions: 0,
+      resolvedPredictions: 0,
+      models: []
+    };
+  }
+
+  /**
+   * Resolver el retorno realizado de cada predicción.
+   * Devuelve arrays paralelos con las predicciones resueltas.
+   */
+  resolve(now) {
+    const log = this.log;
+    const { horizonMs, windowMs } = this.options;
+    const order = log.orderedIndices();
+    const since = now - windowMs - horizonMs;
+
+    // Agrupar índices por símbolo (ya ordenados por tiempo)
+    const bySymbol = new Map();
+    for (let k = 0; k < order.length; k++) {
+      const i = order[k];
+      if (log.timestamps[i] < since) continue;
+      const id = log.symbolIds[i];
+      if (!bySymbol.has(id)) bySymbol.set(id, []);
+      bySymbol.get(id).push(i);
+    }
+
+    const resolved = {
+      symbolIds: [],
+      algorithmIds: [],
+      confidences: [],
+      hits: [],
+      returns: []
+    };
+    let total = 0;
+
+    for (const [symbolId, indices] of bySymbol) {
+      const ts = Float64Array.from(indices, i => log.timestamps[i]);
+      const prices = Float64Array.from(indices, i => log.prices[i]);
+
+      // Dos punteros: primer precio con timestamp >= ts + horizonte
+      let j = 0;
+      for (let k = 0; k < indices.length; k++) {
+        const i = indices[k];
+        const action = log.actions[i];
+        if (action !== ACTIONS.buy && action !== ACTIONS.sell) continue;
+        if (ts[k] < now - windowMs) continue;
+        total++;
+
+        const target = ts[k] + horizonMs;
+        if (j < k) j = k;
+        while (j < indices.length && ts[j] < target) j++;
+        if (j >= indices.length) continue; // Aún no ha pasado el horizonte
+
+        const realized = (prices[j] - prices[k]) / prices[k];
+        const hit = action === ACTIONS.buy ? realized > 0 : realized < 0;
+
+        resolved.symbolIds.push(symbolId);
+        resolved.algorithmIds.push(log.algorithmIds[i]);
+        resolved.confidences.push(log.confidences[i]);
+        resolved.hits.push(hit ? 1 : 0);
+        resolved.returns.push(realized);
+      }
+    }
+
+    return { resolved, total };
+  }
+
+  /**
+   * Métricas de un grupo: hit rate, confianza media, Brier y ECE
+   */
+  summarize(confidences, hits, returns) {
+    const n = confidences.length;
+    const bins = this.options.bins;
+    const binCount = new Float64Array(bins);
+    const binConfidence = new Float64Array(bins);
+    const binHits = new Float64Array(bins);
+
+    let hitSum = 0;
+    let confidenceSum = 0;
+    let brierSum = 0;
+    let returnSum = 0;
+
+    for (let k = 0; k < n; k++) {
+      const c = Math.min(Math.max(confidences[k], 0), 1);
+      const h = hits[k];
+      hitSum += h;
+      confidenceSum += c;
+      brierSum += (c - h) ** 2;
+      returnSum += returns[k];
+
+      const b = Math.min(Math.floor(c * bins), bins - 1);
+      binCount[b]++;
+      binConfidence[b] += c;
+      binHits[b] += h;
+    }
+
+    let calibrationError = 0;
+    const calibration = [];
+    for (let b = 0; b < bins; b++) {
+      if (binCount[b] === 0) continue;
+      const avgConfidence = binConfidence[b] / binCount[b];
+      const hitRate = binHits[b] / binCount[b];
+      calibrationError += (binCount[b] / n) * Math.abs(avgConfidence - hitRate);
+      calibration.push({
+        bin: `${(b / bins).toFixed(1)}-${((b + 1) / bins).toFixed(1)}`,
+        samples: binCount[b],
+        avgConfidence,
+        hitRate
+      });
+    }
+
+    return {
+      samples: n,
+      hitRate: hitSum / n,
+      avgConfidence: confidenceSum / n,
+      avgReturn: returnSum / n,
+      brierScore: brierSum / n,
+      calibrationError,
+      calibration
+    };
+  }
+
+  /**
+   * Recalcular el reporte con todas las predicciones de la ventana
+   */
+  aggregate(now = Date.now()) {
+    const { resolved, total } = this.resolve(now);
+
+    const groups = new Map();
+    for (let k = 0; k < resolved.hits.length; k++) {
+      const key = `${resolved.symbolIds[k]}:${resolved.algorithmIds[k]}`;
+      if (!groups.has(key)) {
+        groups.set(key, {
+          symbolId: resolved.symbolIds[k],
+          algorithmId: resolved.algorithmIds[k],
+          indices: []
+        });
+      }
+      groups.get(key).indices.push(k);
+    }
+
+    const models = [];
+    for (const group of groups.values()) {
+      const pick = arr => Float64Array.from(group.indices, k => arr[k]);
+      const summary = this.summarize(
+        pick(resolved.confidences),
+        pick(resolved.hits),
+        pick(resolved.returns)
+      );
+      models.push({
+        symbol: this.log.symbols[group.symbolId],
+        algorithm: this.log.algorithms[group.algorithmId],
+        ...summary,
+        reliable: summary.samples >= this.options.minSamples
+      });
+    }
+
+    models.sort((a, b) => a.symbol.localeCompare(b.symbol) || a.algorithm.localeCompare(b.algorithm));
+
+    const oldest = this.log.oldestTimestamp();
+    const coveredFrom = oldest === null ? now : Math.max(oldest, now - this.options.windowMs);
+
+    this.report = {
+      ...this.emptyReport(),
+      generatedAt: new Date(now).toISOString(),
+      coveredFrom: oldest === null ? null : new Date(coveredFrom).toISOString(),
+      coveredHours: (now - coveredFrom) / 3600000,
+      totalPredictions: total,
+      resolvedPredictions: resolved.hits.length,
+      models
+    };
+
+    console.log(`📉 Drift calculado: ${resolved.hits.length}/${total} predicciones resueltas`);
+    return this.report;
+  }
+
+  getReport() {
+    return this.report;
+  }
+}
+
+DriftMonitor.DEFAULT_OPTIONS = DEFAULT_OPTIONS;
+
+module.exports = DriftMonitor;
@@ -0,0 +1,75 @@
+/**
+ * Almacenamiento compartido del reporte de drift
+ *
+ * Cada función de Vercel tiene su propia memoria, así que /api/trade guarda
+ * el último reporte en un KV REST (Vercel KV / Upstash) para que
+ * /api/model-drift lo pueda leer. Sin KV_REST_API_URL y KV_REST_API_TOKEN
+ * no se guarda nada.
+ */
+
+const axios = require('axios');
+
+const REPORT_KEY = 'model-drift-report';
+const KV_TIMEOUT_MS = 5000;
+
+function isDriftStoreConfigured() {
+  return Boolean(process.env.KV_REST_API_URL && process.env.KV_REST_API_TOKEN);
+}
+
+function kvRequest(method, path, data) {
+  return axios({
+    method,
+    url: `${process.env.KV_REST_API_URL.replace(/\/$/, '')}${path}`,
+    data,
+    headers: { Authorization: `Bearer ${process.env.KV_REST_API_TOKEN}` },
+    timeout: KV_TIMEOUT_MS
+  });
+}
+
+/**
+ * Un reporte de una instancia recién arrancada cubre menos horas que el
+ * guardado; solo lo reemplaza si cubre al menos lo mismo o si el guardado
+ * ya quedó fuera de la ventana
+ */
+function shouldReplace(stored, report) {
+  if (!stored) return true;
+  if ((report.coveredHours || 0) >= (stored.coveredHours || 0)) return true;
+
+  const storedAt = Date.parse(stored.generatedAt || stored.savedAt);
+  const windowMs = (stored.windowHours || report.windowHours) * 3600000;
+  return !Number.isFinite(storedAt) || Date.now() - storedAt > windowMs;
+}
+
+async function saveDriftReport(report) {
+  if (!isDriftStoreConfigured()) return false;
+
+  try {
+    const stored = await loadDriftReport();
+    if (!shouldReplace(stored, report)) {
+      console.log(`📉 Se conserva el reporte guardado (${stored.coveredHours.toFixed(1)}h > ${report.coveredHours.toFixed(1)}h)`);
+      return false;
+    }
+
+    await kvRequest('post', `/set/${REPORT_KEY}`, JSON.stringify({
+      ...report,
+      savedAt: new Date().toISOString()
+    }));
+    return true;
+  } catch (error) {
+    console.error('Error guardando reporte de drift:', error.message);
+    return false;
+  }
+}
+
+async function loadDriftReport() {
+  if (!isDriftStoreConfigured()) return null;
+
+  const response = await kvRequest('get', `/get/${REPORT_KEY}`);
+  return response.data.result ? JSON.parse(response.data.result) : null;
+}
+
+module.exports = {
+  isDriftStoreConfigured,
+  saveDriftReport,
+  loadDriftReport
+};
@@ -1,11 +1,35 @@
 const { google } = require('googleapis');
 const axios = require('axios');
+const {
+  decodeModelStream,
+  validateModelMetadata,
+  parseModelFileName
+} = require('./model-format');
+const ModelRegistry = require('./model-registry');
+const { PredictionLog } = require('./prediction-log');
+
+// Sin timeout, una descarga colgada dejaría pendingRefresh sin resolver
+const DRIVE_TIMEOUT_MS = 30 * 1000;
+const MODEL_DOWNLOAD_TIMEOUT_MS = 60 * 1000;
 
 class MLModel {
-  constructor() {
-    this.models = {};
-    this.lastUpdate = null;
-    this.metadata = null;
+  constructor({ predictionLogCapacity } = {}) {
+    this.registry = new ModelRegistry();
+    this.pendingRefresh = null;
+    this.predictionLog = new PredictionLog(predictionLogCapacity);
+  }
+
+  // Vistas de la generación publicada actualmente
+  get models() {
+    return this.registry.current.models;
+  }
+
+  get lastUpdate() {
+    return this.registry.current.loadedAt;
+  }
+
+  get metadata() {
+    return this.registry.current.metadata;
   }
 
   async authenticate() {
@@ -26,61 +50,99 @@ class MLModel {
     try {
       // Cargar metadatos desde el repositorio
       const response = await axios.get(
-        `https://raw.githubusercontent.com/${process.env.GITHUB_REPO}/main/models_metadata.json`
+        `https://raw.githubusercontent.com/${process.env.GITHUB_REPO}/main/models_metadata.json`,
+        { timeout: DRIVE_TIMEOUT_MS }
       );
-      this.metadata = response.data;
-      console.log(`📊 Metadatos cargados: ${this.metadata.models.length} modelos disponibles`);
-      return this.metadata;
+      const metadata = response.data;
+      console.log(`📊 Metadatos cargados: ${metadata.models.length} modelos disponibles`);
+      return metadata;
     } catch (error) {
       console.error('Error cargando metadatos:', error);
       return null;
     }
   }
 
-  async downloadModelsFromDrive() {
+  downloadModelsFromDrive() {
+    // Un solo refresco en curso; las llamadas concurrentes lo comparten
+    if (!this.pendingRefresh) {
+      this.pendingRefresh = this.buildGeneration().finally(() => {
+        this.pendingRefresh = null;
+      });
+    }
+    return this.pendingRefresh;
+  }
+
+  refreshInBackground() {
+    if (!this.pendingRefresh) {
+      console.log('🔄 Refrescando modelos en segundo plano...');
+      this.downloadModelsFromDrive();
+    }
+  }
+
+  async buildGeneration() {
     try {
       // Primero cargar metadatos
-      await this.loadMetadata();
+      const metadata = await this.loadMetadata();
       
       const auth = await this.authenticate();
       const drive = google.drive({ version: 'v3', auth });
       const folderId = process.env.GOOGLE_DRIVE_FOLDER_ID;
 
-      // Listar archivos en la carpeta
-      const response = await drive.files.list({
-        q: `'${folderId}' in parents and mimeType='application/json' and trashed=false`,
-        fields: 'files(id, name, modifiedTime)',
-        orderBy: 'modifiedTime desc'
-      });
+      const listed = await this.listModelFiles(drive, folderId);
+
+      // Un listado vacío no reemplaza los modelos actuales
+      if (listed.length === 0) {
+        console.warn('⚠️ Drive no devolvió modelos, se conserva la generación actual');
+        return this.models;
+      }
 
-      const files = response.data.files;
+      // Preferir formato binario; JSON solo como fallback
+      const files = listed
+        .map(file => ({ ...file, ...parseModelFileName(file.name) }))
+        .filter(file => file.format)
+        .sort((a, b) => (a.format === 'binary' ? 0 : 1) - (b.format === 'binary' ? 0 : 1));
       console.log(`📁 Archivos encontrados en Drive: ${files.length}`);
       
+      // La generación nueva se construye aparte; los lectores siguen usando la actual
+      const models = {};
+      const loaded = new Set();
+      const failed = new Set();
       for (const file of files) {
+        if (loaded.has(file.symbol)) continue;
         try {
           // Descargar cada modelo
-          const fileData = await drive.files.get({
-            fileId: file.id,
-            alt: 'media'
-          }, { responseType: 'json' });
+          const data = await this.downloadModelFile(drive, file);
 
-          const symbol = file.name.replace('_model.json', '').replace('_', '/');
-          
-          this.models[symbol] = {
-            data: fileData.data,
+          models[file.symbol] = {
+            data: data,
             lastModified: file.modifiedTime,
-            fileName: file.name
+            fileName: file.name,
+            format: file.format
           };
+          loaded.add(file.symbol);
+          failed.delete(file.symbol);
           
-          console.log(`✅ Modelo cargado: ${symbol} (${fileData.data.algorithm})`);
+          console.log(`✅ Modelo cargado: ${file.symbol} (${data.algorithm}, ${file.format})`);
         } catch (error) {
           console.error(`Error descargando ${file.name}:`, error.message);
+          failed.add(file.symbol);
         }
       }
 
-      this.lastUpdate = new Date();
-      console.log(`🔄 Modelos actualizados: ${Object.keys(this.models).join(', ')}`);
-      return this.models;
+      // Conservar la versión anterior de los modelos que fallaron o que no
+      // aparecieron en el listado, en vez de perderlos
+      const previous = this.models;
+      for (const symbol of Object.keys(previous)) {
+        if (!loaded.has(symbol)) {
+          models[symbol] = previous[symbol];
+          const reason = failed.has(symbol) ? 'falló la descarga' : 'no listado';
+          console.warn(`⚠️ Conservando versión anterior de ${symbol} (${reason})`);
+        }
+      }
+
+      const generation = this.registry.publish(models, metadata);
+      console.log(`🔄 Modelos actualizados (generación ${generation.id}): ${Object.keys(models).join(', ')}`);
+      return generation.models;
       
     } catch (error) {
       console.error('Error descargando modelos de Drive:', error);
@@ -88,6 +150,46 @@ class MLModel {
     }
   }
 
+  async listModelFiles(drive, folderId) {
+    // Listar archivos en la carpeta (binarios y JSON), página por página
+    const files = [];
+    let pageToken;
+    do {
+      const response = await drive.files.list({
+        q: `'${folderId}' in parents and (mimeType='application/octet-stream' or mimeType='application/json') and trashed=false`,
+        fields: 'nextPageToken, files(id, name, modifiedTime, size)',
+        orderBy: 'modifiedTime desc',
+        pageSize: 1000,
+        pageToken
+      }, { timeout: DRIVE_TIMEOUT_MS });
+
+      files.push(...(response.data.files || []));
+      pageToken = response.data.nextPageToken;
+    } while (pageToken);
+
+    return files;
+  }
+
+  async downloadModelFile(drive, file) {
+    if (file.format === 'binary') {
+      // El header se valida antes de descargar el payload completo
+      const fileData = await drive.files.get({
+        fileId: file.id,
+        alt: 'media'
+      }, { responseType: 'stream', timeout: DRIVE_TIMEOUT_MS });
+      return await decodeModelStream(fileData.data, {
+        expectedBytes: file.size ? Number(file.size) : null,
+        timeoutMs: MODEL_DOWNLOAD_TIMEOUT_MS
+      });
+    }
+
+    const fileData = await drive.files.get({
+      fileId: file.id,
+      alt: 'media'
+    }, { responseType: 'json', timeout: MODEL_DOWNLOAD_TIMEOUT_MS });
+    return validateModelMetadata(fileData.data);
+  }
+
   async shouldRefreshModels() {
     if (!this.lastUpdate) return true;
     
@@ -97,13 +199,19 @@ class MLModel {
   }
 
   async getPrediction(symbol, currentPrice, historicalData) {
-    // Refrescar modelos si es necesario
+    // Refrescar modelos si es necesario, sin bloquear la predicción
     if (await this.shouldRefreshModels()) {
-      await this.downloadModelsFromDrive();
+      this.refreshInBackground();
     }
 
-    const model = this.models[symbol];
-    
+    // Leer la generación una sola vez
+    const models = this.registry.current.models;
+    const prediction = this.predictWithModel(models[symbol], symbol, currentPrice, historicalData);
+    this.predictionLog.append(symbol, currentPrice, prediction);
+    return prediction;
+  }
+
+  predictWithModel(model, symbol, currentPrice, historicalData) {
     if (!model) {
       console.log(`⚠️ No hay modelo para ${symbol}, usando estrategia básica`);
       return this.basicStrategy(currentPrice, historicalData);
@@ -201,12 +309,16 @@ class MLModel {
   }
 
   getModelInfo() {
+    // Leer la generación una sola vez
+    const generation = this.registry.current;
     return {
-      totalModels: Object.keys(this.models).length,
-      lastUpdate: this.lastUpdate,
-      metadata: this.metadata,
-      models: Object.entries(this.models).map(([symbol, model]) => ({
+      totalModels: Object.keys(generation.models).length,
+      lastUpdate: generation.loadedAt,
+      metadata: generation.metadata,
+      registry: this.registry.getStats(),
+      models: Object.entries(generation.models).map(([symbol, model]) => ({
         symbol,
+        format: model.format,
         algorithm: model.data.algorithm,
         performance: model.data.performance,
         trainedAt: model.data.trained_at
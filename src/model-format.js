@@ -0,0 +1,337 @@
+/**
+ * Formato binario compacto para modelos
+ *
+ * Layout (little-endian):
+ *   0   4  magic 'ECMB'
+ *   4   1  versión del formato
+ *   5   3  reservado (0)
+ *   8   4  longitud del header en bytes (uint32)
+ *   12  N  header JSON (utf8) con metadatos y tabla de tensores
+ *   ..     padding hasta múltiplo de 4
+ *   ..     payload: tensores float32 consecutivos
+ *
+ * El header se valida en cuanto llegan sus bytes, antes de recibir el
+ * payload, de modo que un archivo corrupto se descarta sin descargarlo entero.
+ * Los pesos se exponen como vistas Float32Array sobre el buffer recibido
+ * (sin copias ni parseo por elemento).
+ */
+
+const fs = require('fs');
+
+const MAGIC = 'ECMB';
+const FORMAT_VERSION = 1;
+const PREFIX_BYTES = 12;
+const MAX_HEADER_BYTES = 1024 * 1024; // 1MB
+const DEFAULT_MAX_PAYLOAD_BYTES = 512 * 1024 * 1024; // 512MB
+
+const BINARY_SUFFIX = '_model.bin';
+const JSON_SUFFIX = '_model.json';
+
+class ModelFormatError extends Error {
+  constructor(message) {
+    super(message);
+    this.name = 'ModelFormatError';
+  }
+}
+
+function align4(n) {
+  return (n + 3) & ~3;
+}
+
+/**
+ * Validar los metadatos comunes a ambos formatos (JSON y binario)
+ */
+function validateModelMetadata(data) {
+  if (!data || typeof data !== 'object') {
+    throw new ModelFormatError('El modelo no es un objeto');
+  }
+  if (typeof data.algorithm !== 'string' || !data.algorithm) {
+    throw new ModelFormatError('Campo "algorithm" inválido');
+  }
+  if (typeof data.performance !== 'number' || !Number.isFinite(data.performance)) {
+    throw new ModelFormatError('Campo "performance" inválido');
+  }
+  if (!data.trained_at || isNaN(new Date(data.trained_at).getTime())) {
+    throw new ModelFormatError('Campo "trained_at" inválido');
+  }
+  return data;
+}
+
+/**
+ * Validar el header binario: metadatos y que cada tensor cabe en el payload
+ */
+function validateHeader(header, maxPayloadBytes = DEFAULT_MAX_PAYLOAD_BYTES) {
+  validateModelMetadata(header);
+
+  const payloadBytes = header.payloadBytes;
+  if (!Number.isInteger(payloadBytes) || payloadBytes < 0 || payloadBytes % 4 !== 0) {
+    throw new ModelFormatError('Campo "payloadBytes" inválido');
+  }
+  if (payloadBytes > maxPayloadBytes) {
+    throw new ModelFormatError(`Payload demasiado grande: ${payloadBytes} bytes`);
+  }
+  if (!Array.isArray(header.tensors)) {
+    throw new ModelFormatError('Campo "tensors" inválido');
+  }
+
+  const names = new Set();
+  for (const tensor of header.tensors) {
+    if (!tensor || typeof tensor.name !== 'string' || !tensor.name) {
+      throw new ModelFormatError('Tensor sin nombre');
+    }
+    if (names.has(tensor.name)) {
+      throw new ModelFormatError(`Tensor duplicado: ${tensor.name}`);
+    }
+    names.add(tensor.name);
+
+    if (!Array.isArray(tensor.shape) || !tensor.shape.every(d => Number.isInteger(d) && d >= 0)) {
+      throw new ModelFormatError(`Shape inválido en tensor ${tensor.name}`);
+    }
+    const length = tensor.shape.reduce((a, b) => a * b, 1);
+    if (!Number.isInteger(tensor.offset) || tensor.offset < 0 || tensor.offset % 4 !== 0) {
+      throw new ModelFormatError(`Offset inválido en tensor ${tensor.name}`);
+    }
+    if (tensor.offset + length * 4 > payloadBytes) {
+      throw new ModelFormatError(`Tensor ${tensor.name} fuera del payload`);
+    }
+  }
+
+  return header;
+}
+
+/**
+ * Leer y validar el prefijo fijo. Devuelve la longitud del header.
+ */
+function readPrefix(buffer) {
+  if (buffer.toString('latin1', 0, 4) !== MAGIC) {
+    throw new ModelFormatError('Magic inválido: no es un modelo binario');
+  }
+  const version = buffer.readUInt8(4);
+  if (version !== FORMAT_VERSION) {
+    throw new ModelFormatError(`Versión de formato no soportada: ${version}`);
+  }
+  const headerLength = buffer.readUInt32LE(8);
+  if (headerLength === 0 || headerLength > MAX_HEADER_BYTES) {
+    throw new ModelFormatError(`Longitud de header inválida: ${headerLength}`);
+  }
+  return headerLength;
+}
+
+function parseHeader(buffer, headerLength, maxPayloadBytes) {
+  let header;
+  try {
+    header = JSON.parse(buffer.toString('utf8', PREFIX_BYTES, PREFIX_BYTES + headerLength));
+  } catch (error) {
+    throw new ModelFormatError(`Header ilegible: ${error.message}`);
+  }
+  return validateHeader(header, maxPayloadBytes);
+}
+
+/**
+ * Construir los datos del modelo con vistas Float32Array sobre el payload
+ */
+function buildModelData(header, buffer, payloadStart) {
+  // Float32Array necesita byteOffset alineado a 4
+  if ((buffer.byteOffset + payloadStart) % 4 !== 0) {
+    const aligned = Buffer.alloc(header.payloadBytes);
+    buffer.copy(aligned, 0, payloadStart, payloadStart + header.payloadBytes);
+    buffer = aligned;
+    payloadStart = 0;
+  }
+
+  const weights = {};
+  for (const tensor of header.tensors) {
+    const length = tensor.shape.reduce((a, b) => a * b, 1);
+    weights[tensor.name] = new Float32Array(
+      buffer.buffer,
+      buffer.byteOffset + payloadStart + tensor.offset,
+      length
+    );
+  }
+
+  const { tensors, payloadBytes, ...metadata } = header;
+  return {
+    ...metadata,
+    shapes: Object.fromEntries(tensors.map(t => [t.name, t.shape])),
+    weights
+  };
+}
+
+/**
+ * Decodificar un modelo binario desde un Buffer completo
+ */
+function decodeModel(buffer, { maxPayloadBytes = DEFAULT_MAX_PAYLOAD_BYTES } = {}) {
+  if (buffer.length < PREFIX_BYTES) {
+    throw new ModelFormatError('Archivo truncado');
+  }
+  const headerLength = readPrefix(buffer);
+  const payloadStart = align4(PREFIX_BYTES + headerLength);
+  if (buffer.length < payloadStart) {
+    throw new ModelFormatError('Archivo truncado');
+  }
+  const header = parseHeader(buffer, headerLength, maxPayloadBytes);
+  if (buffer.length !== payloadStart + header.payloadBytes) {
+    throw new ModelFormatError('Tamaño de archivo no coincide con el header');
+  }
+  return buildModelData(header, buffer, payloadStart);
+}
+
+/**
+ * Decodificar un modelo binario desde un stream (descarga de Drive o archivo).
+ *
+ * El header se valida en cuanto está completo; si es inválido se destruye el
+ * stream y no se sigue descargando. El payload se copia directamente a un
+ * único buffer del tamaño declarado. Con `expectedBytes` (tamaño real del
+ * archivo) se rechaza un header cuyo tamaño no coincide antes de reservar
+ * memoria. Con `timeoutMs` se aborta la descarga si no termina a tiempo.
+ */
+function decodeModelStream(stream, {
+  maxPayloadBytes = DEFAULT_MAX_PAYLOAD_BYTES,
+  expectedBytes = null,
+  timeoutMs = 0
+} = {}) {
+  return new Promise((resolve, reject) => {
+    let pending = [];
+    let pendingBytes = 0;
+    let header = null;
+    let payloadStart = 0;
+    let target = null;
+    let written = 0;
+    let settled = false;
+    let timer = null;
+
+    const fail = (error) => {
+      if (settled) return;
+      settled = true;
+      clearTimeout(timer);
+      stream.destroy();
+      reject(error instanceof ModelFormatError ? error : new ModelFormatError(error.message));
+    };
+
+    const tryReadHeader = () => {
+      const buffer = Buffer.concat(pending, pendingBytes);
+      if (buffer.length < PREFIX_BYTES) return;
+      const headerLength = readPrefix(buffer);
+      const start = align4(PREFIX_BYTES + headerLength);
+      if (buffer.length < start) return;
+
+      header = parseHeader(buffer, headerLength, maxPayloadBytes);
+      payloadStart = start;
+      if (expectedBytes !== null && payloadStart + header.payloadBytes !== expectedBytes) {
+        throw new ModelFormatError(
+          `Tamaño declarado (${payloadStart + header.payloadBytes}) no coincide con el archivo (${expectedBytes})`
+        );
+      }
+      target = Buffer.alloc(payloadStart + header.payloadBytes);
+      written = buffer.copy(target, 0, 0, Math.min(buffer.length, target.length));
+      if (buffer.length > target.length) {
+        throw new ModelFormatError('El archivo excede el tamaño declarado');
+      }
+      pending = null;
+    };
+
+    stream.on('data', (chunk) => {
+      if (settled) return;
+      try {
+        if (!header) {
+          pending.push(chunk);
+          pendingBytes += chunk.length;
+          tryReadHeader();
+          return;
+        }
+        if (written + chunk.length > target.length) {
+          throw new ModelFormatError('El archivo excede el tamaño declarado');
+        }
+        written += chunk.copy(target, written);
+      } catch (error) {
+        fail(error);
+      }
+    });
+
+    stream.on('error', fail);
+
+    if (timeoutMs > 0) {
+      timer = setTimeout(() => fail(new ModelFormatError(`Descarga excedió ${timeoutMs}ms`)), timeoutMs);
+    }
+
+    stream.on('end', () => {
+      if (settled) return;
+      if (!header || written !== target.length) {
+        fail(new ModelFormatError('Archivo truncado'));
+        return;
+      }
+      settled = true;
+      clearTimeout(timer);
+      resolve(buildModelData(header, target, payloadStart));
+    });
+  });
+}
+
+/**
+ * Cargar un modelo binario desde disco
+ */
+async function loadModelFile(filePath, options = {}) {
+  const { size } = await fs.promises.stat(filePath);
+  return decodeModelStream(fs.createReadStream(filePath), { expectedBytes: size, ...options });
+}
+
+/**
+ * Codificar un modelo en formato binario.
+ * `weights` es un objeto { nombre: { shape, values } } con values numérico.
+ */
+function encodeModel(metadata, weights = {}) {
+  const tensors = [];
+  let payloadBytes = 0;
+
+  for (const [name, { shape, values }] of Object.entries(weights)) {
+    tensors.push({ name, shape, offset: payloadBytes });
+    payloadBytes += values.length * 4;
+  }
+
+  const header = validateHeader({ ...metadata, payloadBytes, tensors });
+  const headerBytes = Buffer.from(JSON.stringify(header), 'utf8');
+  const payloadStart = align4(PREFIX_BYTES + headerBytes.length);
+
+  const buffer = Buffer.alloc(payloadStart + payloadBytes);
+  buffer.write(MAGIC, 0, 'latin1');
+  buffer.writeUInt8(FORMAT_VERSION, 4);
+  buffer.writeUInt32LE(headerBytes.length, 8);
+  headerBytes.copy(buffer, PREFIX_BYTES);
+
+  for (const tensor of tensors) {
+    const values = Float32Array.from(weights[tensor.name].values);
+    Buffer.from(values.buffer).copy(buffer, payloadStart + tensor.offset);
+  }
+
+  return buffer;
+}
+
+/**
+ * Obtener el símbolo y formato a partir del nombre de archivo en Drive
+ * (BTC_USD_model.bin -> BTC/USD)
+ */
+function parseModelFileName(fileName) {
+  let format = null;
+  let base = fileName;
+  if (fileName.endsWith(BINARY_SUFFIX)) {
+    format = 'binary';
+    base = fileName.slice(0, -BINARY_SUFFIX.length);
+  } else if (fileName.endsWith(JSON_SUFFIX)) {
+    format = 'json';
+    base = fileName.slice(0, -JSON_SUFFIX.length);
+  }
+  return { symbol: base.replace('_', '/'), format };
+}
+
+module.exports = {
+  MAGIC,
+  FORMAT_VERSION,
+  ModelFormatError,
+  validateModelMetadata,
+  validateHeader,
+  decodeModel,
+  decodeModelStream,
+  loadModelFile,
+  encodeModel,
+  parseModelFileName
+};
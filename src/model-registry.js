@@ -0,0 +1,43 @@
+/**
+ * Registro de modelos por generaciones (double buffering)
+ *
+ * Cada refresco construye una generación nueva aparte y la publica con un
+ * único cambio de puntero. Una generación publicada no se modifica nunca.
+ *
+ * Los lectores deben leer `current` una sola vez por llamada y usar esa
+ * referencia hasta terminar; así nunca ven una mezcla de modelos viejos y
+ * nuevos. Las generaciones reemplazadas las libera el recolector de basura
+ * cuando nadie las referencia.
+ */
+
+class ModelRegistry {
+  constructor() {
+    this.nextId = 1;
+    this.current = this.createGeneration({}, null, null);
+  }
+
+  createGeneration(models, metadata, loadedAt) {
+    return Object.freeze({
+      id: this.nextId++,
+      models: Object.freeze(models),
+      metadata,
+      loadedAt
+    });
+  }
+
+  /**
+   * Publicar una generación nueva de forma atómica
+   */
+  publish(models, metadata) {
+    this.current = this.createGeneration(models, metadata, new Date());
+    return this.current;
+  }
+
+  getStats() {
+    return {
+      generation: this.current.id
+    };
+  }
+}
+
+module.exports = ModelRegistry;
@@ -1,13 +1,14 @@
+const { loadUniverse, positionKey } = require('./universe');
+
 class PortfolioManager {
-  constructor(alpacaClient) {
+  constructor(alpacaClient, universe = loadUniverse()) {
     this.alpaca = alpacaClient;
-    this.targetAssets = [
-      'BTC/USD',
-      'ETH/USD',
-      'LTC/USD',
-      'BCH/USD',
-      'DOGE/USD'
-    ]; // Assets de crypto 24/7
+    this.targetAssets = universe.symbols; // Assets de crypto 24/7
+    this.rebalanceQueue = []; // Símbolos pendientes de un rebalanceo cortado por tiempo
+  }
+
+  hasPendingRebalance() {
+    return this.rebalanceQueue.length > 0;
   }
 
   async diversifyCapital() {
@@ -23,7 +24,7 @@ class PortfolioManager {
 
       const allocation = {};
       for (const symbol of this.targetAssets) {
-        const currentPosition = positions.find(p => p.symbol === symbol);
+        const currentPosition = positions.find(p => positionKey(p.symbol) === positionKey(symbol));
         const currentValue = currentPosition 
           ? parseFloat(currentPosition.market_value) 
           : 0;
@@ -42,14 +43,28 @@ class PortfolioManager {
     }
   }
 
-  async rebalancePortfolio() {
+  async rebalancePortfolio(scheduler = null, prices = {}) {
     try {
+      // Retomar el rebalanceo pendiente o empezar uno nuevo
+      if (this.rebalanceQueue.length === 0) {
+        this.rebalanceQueue = [...this.targetAssets];
+      }
+
       const allocation = await this.diversifyCapital();
       
-      for (const [symbol, data] of Object.entries(allocation)) {
+      while (this.rebalanceQueue.length > 0) {
+        if (scheduler && !scheduler.hasTimeLeft()) {
+          console.warn(`⏱️ Rebalanceo cortado por tiempo, ${this.rebalanceQueue.length} símbolos pasan al siguiente ciclo`);
+          return;
+        }
+
+        const symbol = this.rebalanceQueue.shift();
+        const data = allocation[symbol];
+        if (!data) continue;
+
         // Solo rebalancear si la diferencia es significativa (>10%)
         if (Math.abs(data.difference) > data.target * 0.1) {
-          const currentPrice = await this.alpaca.getCryptoPrice(symbol);
+          const currentPrice = prices[symbol] || await this.alpaca.getCryptoPrice(symbol);
           if (!currentPrice) continue;
 
           const qty = Math.abs(data.difference / currentPrice);
@@ -0,0 +1,96 @@
+/**
+ * Log de predicciones en buffer circular
+ *
+ * Cada entrada guarda timestamp, símbolo, algoritmo, acción, confianza y
+ * precio en arrays tipados de capacidad fija: agregar es O(1) y no genera
+ * objetos. También se registran ticks de precio (sin predicción) para poder
+ * medir el movimiento real después de cada predicción.
+ */
+
+const ACTIONS = { none: 0, buy: 1, sell: 2, hold: 3 };
+const ACTION_NAMES = ['none', 'buy', 'sell', 'hold'];
+
+const MIN_CAPACITY = 20000;
+const CYCLE_MS = 5 * 60 * 1000; // cron de /api/trade en vercel.json
+const ENTRIES_PER_CYCLE = 2; // tick de precio + predicción
+
+class PredictionLog {
+  /**
+   * Capacidad para cubrir `spanMs` con `symbolCount` símbolos por ciclo
+   */
+  static capacityFor(symbolCount, spanMs) {
+    const cycles = Math.ceil(spanMs / CYCLE_MS);
+    return Math.max(MIN_CAPACITY, symbolCount * ENTRIES_PER_CYCLE * cycles);
+  }
+
+  constructor(capacity = MIN_CAPACITY) {
+    this.capacity = capacity;
+    this.timestamps = new Float64Array(capacity);
+    this.prices = new Float64Array(capacity);
+    this.confidences = new Float32Array(capacity);
+    this.symbolIds = new Uint16Array(capacity);
+    this.algorithmIds = new Uint8Array(capacity);
+    this.actions = new Uint8Array(capacity);
+    this.head = 0;
+    this.size = 0;
+
+    // Tablas de strings internados
+    this.symbols = [];
+    this.symbolIndex = new Map();
+    this.algorithms = [];
+    this.algorithmIndex = new Map();
+  }
+
+  intern(value, list, index) {
+    let id = index.get(value);
+    if (id === undefined) {
+      id = list.length;
+      list.push(value);
+      index.set(value, id);
+    }
+    return id;
+  }
+
+  append(symbol, price, prediction = null, timestamp = Date.now()) {
+    const i = this.head;
+    this.timestamps[i] = timestamp;
+    this.prices[i] = price;
+    this.symbolIds[i] = this.intern(symbol, this.symbols, this.symbolIndex);
+
+    if (prediction) {
+      this.actions[i] = ACTIONS[prediction.action] || ACTIONS.hold;
+      this.confidences[i] = prediction.confidence;
+      this.algorithmIds[i] = this.intern(prediction.algorithm || 'unknown', this.algorithms, this.algorithmIndex);
+    } else {
+      this.actions[i] = ACTIONS.none;
+      this.confidences[i] = 0;
+      this.algorithmIds[i] = 0;
+    }
+
+    this.head = (this.head + 1) % this.capacity;
+    if (this.size < this.capacity) this.size++;
+  }
+
+  recordPrice(symbol, price, timestamp = Date.now()) {
+    this.append(symbol, price, null, timestamp);
+  }
+
+  oldestTimestamp() {
+    if (this.size === 0) return null;
+    return this.timestamps[(this.head - this.size + this.capacity) % this.capacity];
+  }
+
+  /**
+   * Índices físicos de las entradas, de la más antigua a la más reciente
+   */
+  orderedIndices() {
+    const start = (this.head - this.size + this.capacity) % this.capacity;
+    const indices = new Uint32Array(this.size);
+    for (let k = 0; k < this.size; k++) {
+      indices[k] = (start + k) % this.capacity;
+    }
+    return indices;
+  }
+}
+
+module.exports = { PredictionLog, ACTIONS, ACTION_NAMES };
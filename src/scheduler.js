@@ -0,0 +1,105 @@
+/**
+ * Planificador de símbolos por prioridad
+ *
+ * Los símbolos con posición abierta o alta volatilidad se evalúan en cada
+ * ciclo; los tranquilos con menos frecuencia. Cada ciclo tiene un presupuesto
+ * de tiempo para no superar el maxDuration de la función.
+ */
+
+const { positionKey } = require('./universe');
+
+const TIER_ORDER = { high: 0, normal: 1, idle: 2 };
+
+class SymbolScheduler {
+  constructor(config) {
+    this.config = config;
+    this.nextDueAt = {};
+    this.deadline = Infinity;
+    this.avgEvaluationMs = 0;
+    // Margen para que el cron de cada 5 minutos no pierda un símbolo por segundos
+    this.graceMs = 60 * 1000;
+  }
+
+  /**
+   * Volatilidad: desviación estándar de los retornos recientes.
+   * Supone un precio por ciclo (ver TradingStrategy.samplePrices).
+   */
+  calculateVolatility(prices) {
+    if (!prices || prices.length < 3) return null;
+
+    const recent = prices.slice(-30);
+    const returns = [];
+    for (let i = 1; i < recent.length; i++) {
+      returns.push((recent[i] - recent[i - 1]) / recent[i - 1]);
+    }
+
+    const mean = returns.reduce((a, b) => a + b, 0) / returns.length;
+    const variance = returns.reduce((a, r) => a + (r - mean) ** 2, 0) / returns.length;
+    return Math.sqrt(variance);
+  }
+
+  classify(hasPosition, prices) {
+    if (hasPosition) return 'high';
+
+    const volatility = this.calculateVolatility(prices);
+    if (volatility === null) return 'normal';
+    if (volatility >= this.config.highVolatility) return 'high';
+    if (volatility < this.config.idleVolatility) return 'idle';
+    return 'normal';
+  }
+
+  /**
+   * Fijar el presupuesto de tiempo de la invocación que empieza en startTime
+   */
+  startCycle(startTime) {
+    this.cycleStart = startTime;
+    this.deadline = startTime + this.config.maxDurationMs * this.config.budgetRatio;
+  }
+
+  /**
+   * Planificar el ciclo: devuelve los símbolos que tocan, ordenados por
+   * prioridad y luego por retraso acumulado
+   */
+  planCycle(symbols, positions, priceHistory, startTime = Date.now()) {
+    this.startCycle(startTime);
+
+    const held = new Set(positions.map(p => positionKey(p.symbol)));
+    const due = [];
+
+    for (const symbol of symbols) {
+      const tier = this.classify(held.has(positionKey(symbol)), priceHistory[symbol]);
+      const nextDueAt = this.nextDueAt[symbol] || 0;
+
+      if (tier === 'high' || nextDueAt <= startTime + this.graceMs) {
+        due.push({ symbol, tier, overdue: startTime - nextDueAt });
+      }
+    }
+
+    due.sort((a, b) => (TIER_ORDER[a.tier] - TIER_ORDER[b.tier]) || (b.overdue - a.overdue));
+
+    console.log(`🗓️ Ciclo planificado: ${due.length}/${symbols.length} símbolos`);
+    return due;
+  }
+
+  /**
+   * Hay tiempo para evaluar otro símbolo sin pasarse del presupuesto
+   */
+  hasTimeLeft() {
+    return Date.now() + this.avgEvaluationMs < this.deadline;
+  }
+
+  timeLeftMs() {
+    return this.deadline - Date.now();
+  }
+
+  recordEvaluation(symbol, tier, elapsedMs) {
+    this.nextDueAt[symbol] = this.cycleStart + this.config.intervalsMinutes[tier] * 60 * 1000;
+
+    // Media móvil exponencial del tiempo por símbolo
+    this.avgEvaluationMs = this.avgEvaluationMs === 0
+      ? elapsedMs
+      : this.avgEvaluationMs * 0.8 + elapsedMs * 0.2;
+  }
+}
+
+module.exports = SymbolScheduler;
@@ -1,56 +1,123 @@
 const AlpacaClient = require('./alpaca');
 const MLModel = require('./ml-model');
 const PortfolioManager = require('./portfolio');
+const SymbolScheduler = require('./scheduler');
+const { loadUniverse, positionKey } = require('./universe');
+const DriftMonitor = require('./drift-monitor');
+const { PredictionLog } = require('./prediction-log');
+const { saveDriftReport } = require('./drift-store');
 
 class TradingStrategy {
   constructor() {
     this.alpaca = new AlpacaClient();
-    this.mlModel = new MLModel();
-    this.portfolio = new PortfolioManager(this.alpaca);
+    this.universe = loadUniverse();
+
+    // Log de predicciones dimensionado para cubrir la ventana de drift
+    const { windowMs, horizonMs } = DriftMonitor.DEFAULT_OPTIONS;
+    this.mlModel = new MLModel({
+      predictionLogCapacity: PredictionLog.capacityFor(this.universe.symbols.length, windowMs + horizonMs)
+    });
+    this.portfolio = new PortfolioManager(this.alpaca, this.universe);
+    this.scheduler = new SymbolScheduler(this.universe.scheduler);
+    this.driftMonitor = new DriftMonitor(this.mlModel.predictionLog);
     this.priceHistory = {};
     this.profitTarget = 0.015; // 1.5% ganancia objetivo (scalping)
     this.stopLoss = 0.01; // 1% stop loss
   }
 
-  async initialize() {
-    await this.mlModel.downloadModelsFromDrive();
+  async initialize(startTime = Date.now()) {
+    // La descarga corre en segundo plano; la espera se limita al presupuesto
+    // del ciclo para no superar el maxDuration en un arranque en frío
+    this.scheduler.startCycle(startTime);
+    this.mlModel.refreshInBackground();
+    await this.waitForModelRefresh();
     console.log('Bot inicializado correctamente');
   }
 
-  async executeScalpingStrategy() {
+  async executeScalpingStrategy(startTime = Date.now()) {
     try {
       const positions = await this.alpaca.getPositions();
+
+      // Muestrear todos los símbolos cada ciclo para que el historial tenga
+      // intervalos uniformes; solo la evaluación se espacia por prioridad
+      const prices = await this.samplePrices();
       
-      for (const symbol of this.portfolio.targetAssets) {
-        await this.processAsset(symbol, positions);
+      const due = this.scheduler.planCycle(
+        this.portfolio.targetAssets,
+        positions,
+        this.priceHistory,
+        startTime
+      );
+
+      let processed = 0;
+      for (const { symbol, tier } of due) {
+        if (!this.scheduler.hasTimeLeft()) {
+          console.warn(`⏱️ Presupuesto de tiempo agotado, ${due.length - processed} símbolos pasan al siguiente ciclo`);
+          break;
+        }
+        const assetStart = Date.now();
+        await this.processAsset(symbol, positions, prices[symbol]);
+        this.scheduler.recordEvaluation(symbol, tier, Date.now() - assetStart);
+        processed++;
       }
 
-      // Rebalancear portafolio cada 6 horas
+      // Rebalancear portafolio cada 6 horas (o continuar uno cortado por tiempo)
       const hour = new Date().getHours();
-      if (hour % 6 === 0) {
-        await this.portfolio.rebalancePortfolio();
+      const rebalanceDue = hour % 6 === 0 || this.portfolio.hasPendingRebalance();
+      if (rebalanceDue && this.scheduler.hasTimeLeft()) {
+        await this.portfolio.rebalancePortfolio(this.scheduler, prices);
+      }
+
+      // Cruzar predicciones con precios reales fuera del camino de predicción
+      const driftReport = this.driftMonitor.aggregate();
+      if (this.scheduler.hasTimeLeft()) {
+        await saveDriftReport(driftReport);
       }
 
+      // Vercel congela la función al responder: terminar aquí el refresco de modelos
+      await this.waitForModelRefresh();
+
     } catch (error) {
       console.error('Error ejecutando estrategia:', error);
     }
   }
 
-  async processAsset(symbol, positions) {
-    try {
-      const currentPrice = await this.alpaca.getCryptoPrice(symbol);
-      if (!currentPrice) return;
+  async waitForModelRefresh() {
+    const pending = this.mlModel.pendingRefresh;
+    const remaining = this.scheduler.timeLeftMs();
+    if (!pending || remaining <= 0) return;
+
+    let timer;
+    const timeout = new Promise(resolve => {
+      timer = setTimeout(resolve, remaining);
+    });
+    await Promise.race([pending, timeout]);
+    clearTimeout(timer);
+  }
 
+  async samplePrices() {
+    const prices = await this.alpaca.getCryptoPrices(this.portfolio.targetAssets);
+
+    for (const [symbol, price] of Object.entries(prices)) {
       // Actualizar historial de precios
       if (!this.priceHistory[symbol]) {
         this.priceHistory[symbol] = [];
       }
-      this.priceHistory[symbol].push(currentPrice);
+      this.priceHistory[symbol].push(price);
       if (this.priceHistory[symbol].length > 100) {
         this.priceHistory[symbol].shift();
       }
+      this.mlModel.predictionLog.recordPrice(symbol, price);
+    }
+
+    return prices;
+  }
+
+  async processAsset(symbol, positions, currentPrice) {
+    try {
+      if (!currentPrice) return;
 
-      const position = positions.find(p => p.symbol === symbol);
+      const position = positions.find(p => positionKey(p.symbol) === positionKey(symbol));
 
       if (position) {
         // Ya tenemos posición - evaluar venta
@@ -0,0 +1,79 @@
+/**
+ * Universo de símbolos configurable
+ *
+ * Se carga desde config/universe.json (o desde la ruta en SYMBOL_UNIVERSE_PATH)
+ * y lo comparten el bot y el dashboard.
+ */
+
+const fs = require('fs');
+const defaultConfig = require('../config/universe.json');
+
+const SYMBOL_PATTERN = /^[A-Z0-9]+\/[A-Z0-9]+$/;
+
+const DEFAULT_SCHEDULER = {
+  maxDurationMs: 300000, // maxDuration de las funciones en vercel.json
+  budgetRatio: 0.8,
+  highVolatility: 0.01,
+  idleVolatility: 0.002,
+  intervalsMinutes: {
+    high: 5,
+    normal: 15,
+    idle: 30
+  }
+};
+
+/**
+ * Clave de comparación con las posiciones de Alpaca, que llegan sin barra
+ * (BTCUSD) aunque las órdenes y el universo usen BTC/USD
+ */
+function positionKey(symbol) {
+  return symbol.replace('/', '');
+}
+
+function loadUniverse(filePath = process.env.SYMBOL_UNIVERSE_PATH) {
+  let config = defaultConfig;
+
+  if (filePath) {
+    try {
+      config = JSON.parse(fs.readFileSync(filePath, 'utf8'));
+    } catch (error) {
+      console.error(`Error cargando universo desde ${filePath}, usando el de por defecto:`, error.message);
+      config = defaultConfig;
+    }
+  }
+
+  const assets = [];
+  const seen = new Set();
+  for (const entry of config.symbols || []) {
+    const asset = typeof entry === 'string' ? { symbol: entry } : entry;
+    const symbol = (asset.symbol || '').toUpperCase();
+
+    if (!SYMBOL_PATTERN.test(symbol)) {
+      console.warn(`⚠️ Símbolo inválido en universo: ${asset.symbol}`);
+      continue;
+    }
+    if (seen.has(symbol)) continue;
+
+    seen.add(symbol);
+    assets.push({ symbol, name: asset.name || symbol });
+  }
+
+  const scheduler = {
+    ...DEFAULT_SCHEDULER,
+    ...(config.scheduler || {}),
+    intervalsMinutes: {
+      ...DEFAULT_SCHEDULER.intervalsMinutes,
+      ...((config.scheduler || {}).intervalsMinutes || {})
+    }
+  };
+
+  console.log(`🌐 Universo cargado: ${assets.length} símbolos`);
+
+  return {
+    assets,
+    symbols: assets.map(a => a.symbol),
+    scheduler
+  };
+}
+
+module.exports = { loadUniverse, positionKey };
@@ -50,6 +50,10 @@ class VercelAPIClient:
         """Obtener estado de los modelos ML"""
         return self._make_request('/api/model-status')
     
+    def get_model_drift(self) -> Dict[str, Any]:
+        """Obtener drift de los modelos (predicciones vs resultados reales)"""
+        return self._make_request('/api/model-drift')
+    
     def refresh_models(self) -> Dict[str, Any]:
         """Refrescar modelos desde Google Drive"""
         return self._make_request('/api/refresh-models', method='POST')
@@ -2,13 +2,17 @@
 Fetcher de datos de Alpaca
 """
 
-import alpaca_trade_api as tradeapi
-import pandas as pd
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import TYPE_CHECKING, List, Dict, Optional
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 class AlpacaDataFetcher:
     def __init__(self, api_key: str, secret_key: str, paper: bool = True):
+        # Importación diferida: alpaca_trade_api es pesado
+        import alpaca_trade_api as tradeapi
+        
         self.api = tradeapi.REST(
             api_key,
             secret_key,
@@ -71,8 +75,10 @@ class AlpacaDataFetcher:
             print(f"Error getting orders: {e}")
             return []
     
-    def get_crypto_bars(self, symbol: str, timeframe: str = '15Min', limit: int = 100) -> Optional[pd.DataFrame]:
+    def get_crypto_bars(self, symbol: str, timeframe: str = '15Min', limit: int = 100) -> Optional['pd.DataFrame']:
         """Obtener barras de criptomonedas"""
+        import alpaca_trade_api as tradeapi
+        
         try:
             # Mapear timeframe
             tf_map = {
@@ -0,0 +1,82 @@
+"""
+Universo de símbolos compartido con el bot (config/universe.json)
+"""
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, List, Optional
+
+DEFAULT_UNIVERSE_PATH = Path(__file__).resolve().parent.parent / 'config' / 'universe.json'
+
+# Mismo patrón que src/universe.js
+SYMBOL_PATTERN = re.compile(r'^[A-Z0-9]+/[A-Z0-9]+$')
+
+
+def _read_config(path) -> Dict:
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_universe(path: Optional[str] = None) -> List[Dict[str, str]]:
+    """Cargar la lista de símbolos del universo (mismas reglas que src/universe.js)"""
+    universe_path = path or os.environ.get('SYMBOL_UNIVERSE_PATH')
+    config = None
+
+    if universe_path:
+        try:
+            config = _read_config(universe_path)
+        except (OSError, ValueError) as e:
+            print(f"Error cargando universo desde {universe_path}, usando el de por defecto: {e}")
+
+    if config is None:
+        config = _read_config(DEFAULT_UNIVERSE_PATH)
+
+    assets = []
+    seen = set()
+    for entry in config.get('symbols', []):
+        asset = {'symbol': entry} if isinstance(entry, str) else entry
+        symbol = (asset.get('symbol') or '').upper()
+        if not SYMBOL_PATTERN.fullmatch(symbol):
+            print(f"⚠️ Símbolo inválido en universo: {asset.get('symbol')}")
+            continue
+        if symbol in seen:
+            continue
+        seen.add(symbol)
+        assets.append({'symbol': symbol, 'name': asset.get('name') or symbol})
+
+    return assets
+
+
+class SymbolIndex:
+    """Índice de búsqueda sobre el universo de símbolos"""
+
+    def __init__(self, assets: List[Dict[str, str]]):
+        self.assets = assets
+        self.symbols = [a['symbol'] for a in assets]
+        # Claves en minúsculas: símbolo, símbolo sin separador y nombre
+        self._keys = [
+            (a['symbol'].lower(), a['symbol'].replace('/', '').lower(), a['name'].lower())
+            for a in assets
+        ]
+
+    def search(self, query: str, limit: int = 50) -> List[str]:
+        """Buscar símbolos: coincidencia exacta, luego prefijo, luego subcadena"""
+        query = (query or '').strip().lower()
+        if not query:
+            return self.symbols[:limit]
+
+        exact, prefix, contains = [], [], []
+        for symbol, (key, compact, name) in zip(self.symbols, self._keys):
+            if query in (key, compact):
+                exact.append(symbol)
+            elif key.startswith(query) or compact.startswith(query) or name.startswith(query):
+                prefix.append(symbol)
+            elif query in key or query in name:
+                contains.append(symbol)
+
+        return (exact + prefix + contains)[:limit]
+
+    def __len__(self) -> int:
+        return len(self.symbols)